@@ -12,7 +12,6 @@ import scipy.sparse as sps
 import porepy as pp
 
 from porepy.utils import tags
-from porepy.utils.matrix_compression import rldecode
 from porepy.utils.setmembership import unique_columns_tol, ismember_rows
 
 from porepy.fracs import tools as fractools
@@ -531,7 +530,7 @@ def update_cell_faces(
     cf_2_f[delete_faces] = np.arange(delete_faces.size)
 
     # Map from faces, as stored in cell_faces,to the corresponding cells
-    face_2_cell = rldecode(np.arange(indptr.size), np.diff(indptr))
+    face_2_cell = np.repeat(np.arange(indptr.size - 1), np.diff(indptr))
 
     # The cell-face map will go from 3 faces per cell to an arbitrary number.
     # Split mapping into list of arrays to prepare for this
@@ -653,9 +653,9 @@ class Grid:
         zeros = np.zeros(self.num_faces, dtype=np.bool)
         self.tags["domain_boundary_faces"] = zeros
         if self.dim > 0:  # by default no 0d grid at the boundary of the domain
-            bd_faces = np.argwhere(
-                np.abs(self.cell_faces).sum(axis=1).A.ravel("F") == 1
-            ).ravel("F")
+            # Boundary faces have a single cell neighbor. Only the sparsity
+            # structure of cell_faces is needed to find them.
+            bd_faces = np.argwhere(self.cell_faces.getnnz(axis=1) == 1).ravel("F")
             self.tags["domain_boundary_faces"][bd_faces] = True
 
     def set_periodic_map(self, periodic_face_map: np.ndarray) -> None:
@@ -757,7 +757,7 @@ class Grid:
         """
         n = self.cell_faces.tocsr()
         d = np.diff(n.indptr)
-        rows = matrix_compression.rldecode(np.arange(d.size), d)
+        rows = np.repeat(np.arange(d.size), d)
         # Increase the data by one to distinguish cell indices from boundary
         # cells
         data = n.indices + 1
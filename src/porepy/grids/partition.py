@@ -110,28 +110,27 @@ def partition_structured(
         if incr_ind.size > coarse_dims[i]:
             incr_ind = incr_ind[:-1]
 
-        # Array for coarse index of fine cells
-        loc_ind = np.zeros(fine_dims[i])
-        # The index will increase by one
-        loc_ind[incr_ind] += 1
-        # A cumulative sum now gives the index, but subtract by one to be
-        # 0-offset
-        ind.append(np.cumsum(loc_ind) - 1)
-
-    # Then combine the indexes. In 2D meshgrid does the job, in 3D it turned
-    # out that some acrobatics was necessary to get the right ordering of the
-    # cells.
+        # The coarse index of a fine cell is the number of increment points
+        # up to and including the cell, minus one to be 0-offset. Since the
+        # increments are equidistant, this is a floor division, with any extra
+        # cells lumped into the last coarse index.
+        ind.append(
+            np.minimum(np.arange(fine_dims[i]) // fine_per_coarse[i], incr_ind.size - 1)
+        )
+
+    # Then combine the indexes. The cells of a CartGrid are ordered with x
+    # running fastest, then y, then z, so the indices are broadcast with the
+    # z-index along the first axis and the x-index along the last.
     if nd == 2:
-        xi, yi = np.meshgrid(ind[0], ind[1])
-        # y-index jumps in steps of the number of coarse x-cells
-        glob_dims = (xi + yi * coarse_dims[0]).ravel("C")
+        # y-index jumps in steps of the number of coarse x-cells.
+        glob_dims = np.add.outer(ind[1] * coarse_dims[0], ind[0]).ravel("C")
     elif nd == 3:
-        xi, yi, zi = np.meshgrid(ind[0], ind[1], ind[2])
         # Combine indices, with appropriate jumps in y and z counting
-        glob_dims = xi + yi * coarse_dims[0] + zi * np.prod(coarse_dims[:2])
-        # This just happened to work, may be logical, but the documentanion of
-        # np.meshgrid was hard to comprehend.
-        glob_dims = np.swapaxes(np.swapaxes(glob_dims, 1, 2), 0, 1).ravel("C")
+        glob_dims = (
+            ind[0][np.newaxis, np.newaxis, :]
+            + ind[1][np.newaxis, :, np.newaxis] * coarse_dims[0]
+            + ind[2][:, np.newaxis, np.newaxis] * np.prod(coarse_dims[:2])
+        ).ravel("C")
 
     # Return an int
     return glob_dims.astype("int")
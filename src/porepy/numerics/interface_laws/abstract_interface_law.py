@@ -2,14 +2,28 @@
 Mother class for all interface laws.
 """
 import abc
+import functools
 import numpy as np
 import scipy.sparse as sps
-from typing import Dict, Union, Tuple
+from typing import Dict, Optional, Tuple
 
 import porepy as pp
 from porepy.numerics.discretization import Discretization
 
 
+@functools.lru_cache(maxsize=1024)
+def _empty_block(num_rows: int, num_cols: int) -> sps.coo_matrix:
+    """ Empty sparse matrix of a given size, used as a template for the blocks of
+    local block matrices.
+
+    Interfaces tend to reuse the same block sizes, and copying a cached empty
+    matrix is cheaper than constructing a new one. The cached matrix should not
+    be handed out directly; use a copy to ensure that blocks are never shared.
+
+    """
+    return sps.coo_matrix((num_rows, num_cols))
+
+
 class AbstractInterfaceLaw(abc.ABC):
     """ Partial implementation of an interface (between two grids) law. Any full
     interface law must implement the missing functions.
@@ -112,7 +126,7 @@ class AbstractInterfaceLaw(abc.ABC):
         data_slave: Dict,
         data_edge: Dict,
         matrix: np.ndarray,
-    ) -> Union[np.ndarray, np.ndarray]:
+    ) -> Tuple[np.ndarray, np.ndarray]:
         """ Assemble the dicretization of the interface law, and its impact on
         the neighboring domains.
 
@@ -145,7 +159,7 @@ class AbstractInterfaceLaw(abc.ABC):
         discr_slave: Discretization,
         mg: pp.MortarGrid,
         matrix: np.ndarray,
-    ) -> Union[np.ndarray, np.ndarray]:
+    ) -> Tuple[np.ndarray, np.ndarray]:
         """ Initialize a block matrix and right hand side for the local linear
         system of the master and slave grid and the interface.
 
@@ -167,51 +181,19 @@ class AbstractInterfaceLaw(abc.ABC):
                 represent the master, slave and mortar variable, respectively.
                 Each of the blocks have an empty sparse matrix with size
                 corresponding to the number of dofs of the grid and variable.
+                The blocks are in coo format, and are meant to be replaced by,
+                or added to, the coupling terms; they are not suited for
+                assignment of individual elements.
             np.array: Block matrix of size 3 x 1, representing the right hand
                 side of this coupling. Index 0, 1 and 2 represent the master,
                 slave and mortar variable, respectively.
 
         """
 
-        master_ind = 0
-        slave_ind = 1
-        mortar_ind = 2
-
-        dof_master = discr_master.ndof(g_master)
-        dof_slave = discr_slave.ndof(g_slave)
-        dof_mortar = self.ndof(mg)
-
-        if not dof_master == matrix[master_ind, master_ind].shape[1]:
-            raise ValueError(
-                """The number of dofs of the master discretization given
-            in the coupling discretization must match the number of dofs given by the matrix
-            """
-            )
-        elif not dof_slave == matrix[master_ind, slave_ind].shape[1]:
-            raise ValueError(
-                """The number of dofs of the slave discretization given
-            in the coupling discretization must match the number of dofs given by the matrix
-            """
-            )
-        elif not self.ndof(mg) == matrix[master_ind, mortar_ind].shape[1]:
-            raise ValueError(
-                """The number of dofs of the edge discretization given
-            in the coupling discretization must match the number of dofs given by the matrix
-            """
-            )
-        # We know the number of dofs from the master and slave side from their
-        # discretizations
-        dof = np.array([dof_master, dof_slave, dof_mortar])
-        cc = np.array([sps.coo_matrix((i, j)) for i in dof for j in dof])
-        cc = cc.reshape((3, 3))
-
-        # The rhs is just zeros
-        rhs = np.empty(3, dtype=np.object)
-        rhs[master_ind] = np.zeros(dof_master)
-        rhs[slave_ind] = np.zeros(dof_slave)
-        rhs[mortar_ind] = np.zeros(dof_mortar)
-
-        return cc, rhs
+        dof = (discr_master.ndof(g_master), discr_slave.ndof(g_slave), self.ndof(mg))
+        return self._define_local_block_matrix_from_dofs(
+            dof, matrix, ("master", "slave", "edge")
+        )
 
     def _define_local_block_matrix_edge_coupling(
         self,
@@ -220,7 +202,7 @@ class AbstractInterfaceLaw(abc.ABC):
         mg_primary: pp.MortarGrid,
         mg_secondary: pp.MortarGrid,
         matrix: np.ndarray,
-    ) -> Union[np.ndarray, np.ndarray]:
+    ) -> Tuple[np.ndarray, np.ndarray]:
         """ Initialize a block matrix and right hand side for the local linear
         system of the master and slave grid and the interface.
 
@@ -242,52 +224,78 @@ class AbstractInterfaceLaw(abc.ABC):
                 represent the master, slave and mortar variable, respectively.
                 Each of the blocks have an empty sparse matrix with size
                 corresponding to the number of dofs of the grid and variable.
+                The blocks are in coo format, and are meant to be replaced by,
+                or added to, the coupling terms; they are not suited for
+                assignment of individual elements.
             np.array: Block matrix of size 3 x 1, representing the right hand
                 side of this coupling. Index 0, 1 and 2 represent the master,
                 slave and mortar variable, respectively.
 
         """
 
-        grid_ind = 0
-        primary_ind = 1
-        secondary_ind = 2
+        dof = (discr_grid.ndof(g), self.ndof(mg_primary), self.ndof(mg_secondary))
+        return self._define_local_block_matrix_from_dofs(
+            dof, matrix, ("grid", "primary edge", "secondary edge")
+        )
 
-        dof_grid = discr_grid.ndof(g)
-        dof_mortar_primary = self.ndof(mg_primary)
-        dof_mortar_secondary = self.ndof(mg_secondary)
+    def _define_local_block_matrix_from_dofs(
+        self, dof: Tuple[int, int, int], matrix: np.ndarray, names: Tuple[str, str, str]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """ Initialize a local block matrix and right hand side for given numbers
+        of dofs.
 
-        if not dof_grid == matrix[grid_ind, grid_ind].shape[1]:
-            raise ValueError(
-                """The number of dofs of the master discretization given
-            in the coupling discretization must match the number of dofs given by the matrix
-            """
-            )
-        elif not dof_mortar_primary == matrix[grid_ind, primary_ind].shape[1]:
-            raise ValueError(
-                """The number of dofs of the slave discretization given
-            in the coupling discretization must match the number of dofs given by the matrix
-            """
-            )
-        elif not dof_mortar_secondary == matrix[grid_ind, secondary_ind].shape[1]:
-            raise ValueError(
-                """The number of dofs of the edge discretization given
+        Shared implementation of _define_local_block_matrix() and
+        _define_local_block_matrix_edge_coupling().
+
+        Parameters:
+            dof (tuple of int): Number of dofs of the three variables.
+            matrix (np.ndarray): Original discretization. The number of columns in
+                the first block row are checked against dof.
+            names (tuple of str): Names of the three variables, used in the error
+                messages.
+
+        Returns:
+            np.array: Block matrix of size 3 x 3, with empty blocks in coo format.
+            np.array: Block matrix of size 3 x 1, with zero blocks.
+
+        Raises:
+            ValueError: If the number of dofs does not match matrix.
+
+        """
+        for ind in range(3):
+            if not dof[ind] == matrix[0, ind].shape[1]:
+                raise ValueError(
+                    f"""The number of dofs of the {names[ind]} discretization given
             in the coupling discretization must match the number of dofs given by the matrix
             """
-            )
-        # We know the number of dofs from the master and slave side from their
-        # discretizations
-        dof = np.array([dof_grid, dof_mortar_primary, dof_mortar_secondary])
-        cc = np.array([sps.coo_matrix((i, j)) for i in dof for j in dof])
-        cc = cc.reshape((3, 3))
+                )
+
+        cc = self._empty_local_block_matrix(dof)
 
         # The rhs is just zeros
-        rhs = np.empty(3, dtype=np.object)
-        rhs[grid_ind] = np.zeros(dof_grid)
-        rhs[primary_ind] = np.zeros(dof_mortar_primary)
-        rhs[secondary_ind] = np.zeros(dof_mortar_secondary)
+        rhs = np.empty(3, dtype=object)
+        for ri in range(3):
+            rhs[ri] = np.zeros(dof[ri])
 
         return cc, rhs
 
+    def _empty_local_block_matrix(self, dof: Tuple[int, int, int]) -> np.ndarray:
+        """ Initialize a 3 x 3 block matrix of empty sparse matrices.
+
+        Parameters:
+            dof (tuple of int): Number of dofs of the three variables.
+
+        Returns:
+            np.array: Block matrix of size 3 x 3, where block (i, j) is an empty
+                coo matrix of size dof[i] x dof[j]. The blocks are distinct objects.
+
+        """
+        cc = np.empty((3, 3), dtype=object)
+        for ri in range(3):
+            for ci in range(3):
+                cc[ri, ci] = _empty_block(dof[ri], dof[ci]).copy()
+        return cc
+
     def assemble_edge_coupling_via_high_dim(
         self,
         g_between: pp.Grid,
@@ -297,12 +305,14 @@ class AbstractInterfaceLaw(abc.ABC):
         edge_secondary: Tuple[pp.Grid, pp.Grid],
         data_edge_secondary: Dict,
         matrix: np.ndarray,
-    ) -> Union[np.ndarray, np.ndarray]:
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
         """ Method to assemble the contribution from one interface to another one.
 
         The method must be implemented for subclasses of AbstractInterfaceLaw which has
         the attribute edge_coupling_via_high_dim set to True. For classes where the
-        variable is False, there is no need for action.
+        variable is False, there is no need for action: pp.Assembler checks the
+        attribute and only calls this method if it is True, and the default
+        implementation returns None.
 
         Note that the mixed-dimensional modeling framework does not allow for direct
         couplings between interfaces. However, there may be cases where an interface law
@@ -342,8 +352,7 @@ class AbstractInterfaceLaw(abc.ABC):
                 """Interface laws with edge couplings via the high
                                       dimensional grid must implement this model"""
             )
-        else:
-            pass
+        return None
 
     def assemble_edge_coupling_via_low_dim(
         self,
@@ -354,12 +363,14 @@ class AbstractInterfaceLaw(abc.ABC):
         edge_secondary: Tuple[pp.Grid, pp.Grid],
         data_edge_secondary: Dict,
         matrix: np.ndarray,
-    ) -> Union[np.ndarray, np.ndarray]:
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
         """ Method to assemble the contribution from one interface to another one.
 
         The method must be implemented for subclasses of AbstractInterfaceLaw which has
         the attribute edge_coupling_via_low_dim set to True. For classes where the
-        variable is False, there is no need for action.
+        variable is False, there is no need for action: pp.Assembler checks the
+        attribute and only calls this method if it is True, and the default
+        implementation returns None.
 
         Note that the mixed-dimensional modeling framework does not allow for direct
         couplings between interfaces. However, there may be cases where an interface law
@@ -398,5 +409,4 @@ class AbstractInterfaceLaw(abc.ABC):
                 """Interface laws with edge couplings via the high
                                       dimensional grid must implement this model"""
             )
-        else:
-            pass
+        return None
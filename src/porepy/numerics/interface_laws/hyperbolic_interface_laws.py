@@ -62,9 +62,8 @@ class UpwindCoupling(
 
         # We know the number of dofs from the master and slave side from their
         # discretizations
-        dof = np.array([matrix[0, 0].shape[1], matrix[1, 1].shape[1], g_m.num_cells])
-        cc = np.array([sps.coo_matrix((i, j)) for i in dof for j in dof])
-        cc = cc.reshape((3, 3))
+        dof = (matrix[0, 0].shape[1], matrix[1, 1].shape[1], g_m.num_cells)
+        cc = self._empty_local_block_matrix(dof)
 
         # Projection from mortar to upper dimenional faces
         hat_P_avg = g_m.master_to_mortar_avg()
@@ -0,0 +1,141 @@
+"""
+Tests of class AbstractInterfaceLaw in module
+porepy.numerics.interface_laws.abstract_interface_law
+"""
+import unittest
+
+import numpy as np
+import scipy.sparse as sps
+
+from porepy.numerics.interface_laws.abstract_interface_law import (
+    AbstractInterfaceLaw,
+    _empty_block,
+)
+
+
+class MockLaw(AbstractInterfaceLaw):
+    def ndof(self, mg):
+        return mg.num_cells
+
+    def discretize(self, g_h, g_l, data_h, data_l, data_edge):
+        pass
+
+    def assemble_matrix_rhs(
+        self, g_master, g_slave, data_master, data_slave, data_edge, matrix
+    ):
+        pass
+
+
+class TestAbstractMethods(unittest.TestCase):
+    def test_abstract_methods(self):
+        # The edge couplings are optional, and gated by flags rather than abc
+        self.assertEqual(
+            AbstractInterfaceLaw.__abstractmethods__,
+            frozenset(("ndof", "discretize", "assemble_matrix_rhs")),
+        )
+
+    def test_edge_coupling_is_noop_without_flag(self):
+        law = MockLaw("flow")
+        args = (None, {}, (None, None), {}, (None, None), {}, None)
+        self.assertIsNone(law.assemble_edge_coupling_via_high_dim(*args))
+        self.assertIsNone(law.assemble_edge_coupling_via_low_dim(*args))
+
+    def test_edge_coupling_requires_implementation_with_flag(self):
+        law = MockLaw("flow")
+        law.edge_coupling_via_high_dim = True
+        args = (None, {}, (None, None), {}, (None, None), {}, None)
+        self.assertRaises(
+            NotImplementedError, law.assemble_edge_coupling_via_high_dim, *args
+        )
+
+        law = MockLaw("flow")
+        law.edge_coupling_via_low_dim = True
+        self.assertRaises(
+            NotImplementedError, law.assemble_edge_coupling_via_low_dim, *args
+        )
+
+
+class MockGrid:
+    def __init__(self, num_cells):
+        self.num_cells = num_cells
+
+
+class MockDiscretization:
+    def ndof(self, g):
+        return g.num_cells
+
+
+class TestDefineLocalBlockMatrix(unittest.TestCase):
+    def _matrix(self, dof):
+        matrix = np.empty((3, 3), dtype=object)
+        for ri in range(3):
+            for ci in range(3):
+                matrix[ri, ci] = sps.csc_matrix((dof[ri], dof[ci]))
+        return matrix
+
+    def _check_blocks(self, cc, rhs, dof):
+        self.assertEqual(cc.shape, (3, 3))
+        self.assertEqual(rhs.shape, (3,))
+        blocks = cc.ravel().tolist()
+        for ri in range(3):
+            self.assertEqual(rhs[ri].size, dof[ri])
+            self.assertTrue(np.all(rhs[ri] == 0))
+            for ci in range(3):
+                self.assertEqual(cc[ri, ci].shape, (dof[ri], dof[ci]))
+                self.assertEqual(cc[ri, ci].nnz, 0)
+                self.assertFalse(cc[ri, ci] is _empty_block(dof[ri], dof[ci]))
+        # No block should be shared with another
+        self.assertEqual(len(set(id(b) for b in blocks)), 9)
+
+    def _define_local_block_matrix(self, dof, matrix):
+        return MockLaw("flow")._define_local_block_matrix(
+            MockGrid(dof[0]),
+            MockGrid(dof[1]),
+            MockDiscretization(),
+            MockDiscretization(),
+            MockGrid(dof[2]),
+            matrix,
+        )
+
+    def _define_local_block_matrix_edge_coupling(self, dof, matrix):
+        return MockLaw("flow")._define_local_block_matrix_edge_coupling(
+            MockGrid(dof[0]),
+            MockDiscretization(),
+            MockGrid(dof[1]),
+            MockGrid(dof[2]),
+            matrix,
+        )
+
+    def test_define_local_block_matrix(self):
+        dof = (5, 3, 2)
+        cc, rhs = self._define_local_block_matrix(dof, self._matrix(dof))
+        self._check_blocks(cc, rhs, dof)
+
+    def test_define_local_block_matrix_edge_coupling(self):
+        dof = (5, 3, 2)
+        cc, rhs = self._define_local_block_matrix_edge_coupling(dof, self._matrix(dof))
+        self._check_blocks(cc, rhs, dof)
+
+    def test_define_local_block_matrix_mismatch(self):
+        dof = (5, 3, 2)
+        for ind, name in enumerate(("master", "slave", "edge")):
+            wrong_dof = list(dof)
+            wrong_dof[ind] += 1
+            with self.assertRaises(ValueError) as cm:
+                self._define_local_block_matrix(wrong_dof, self._matrix(dof))
+            self.assertIn("dofs of the " + name + " discretization", str(cm.exception))
+
+    def test_define_local_block_matrix_edge_coupling_mismatch(self):
+        dof = (5, 3, 2)
+        for ind, name in enumerate(("grid", "primary edge", "secondary edge")):
+            wrong_dof = list(dof)
+            wrong_dof[ind] += 1
+            with self.assertRaises(ValueError) as cm:
+                self._define_local_block_matrix_edge_coupling(
+                    wrong_dof, self._matrix(dof)
+                )
+            self.assertIn("dofs of the " + name + " discretization", str(cm.exception))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -17,14 +17,14 @@ def add_data(gb, domain, kf):
     gb.add_node_props(["param", "is_tangential"])
     tol = 1e-5
     a = 1e-4
+    dim_max = gb.dim_max()
 
     for g, d in gb:
         # Assign aperture
-        a_dim = np.power(a, gb.dim_max() - g.dim)
-        aperture = np.ones(g.num_cells) * a_dim
+        a_dim = np.power(a, dim_max - g.dim)
 
         # Effective permeability, scaled with aperture.
-        kxx = np.ones(g.num_cells) * np.power(kf, g.dim < gb.dim_max()) * aperture
+        kxx = np.full(g.num_cells, np.power(kf, g.dim < dim_max) * a_dim)
         if g.dim == 2:
             perm = pp.SecondOrderTensor(kxx=kxx, kyy=kxx, kzz=1)
         else:
@@ -34,19 +34,25 @@ def add_data(gb, domain, kf):
         # Boundaries
         bound_faces = g.tags["domain_boundary_faces"].nonzero()[0]
         if bound_faces.size != 0:
-            bound_face_centers = g.face_centers[:, bound_faces]
+            x = g.face_centers[0, bound_faces]
 
-            left = bound_face_centers[0, :] < domain["xmin"] + tol
-            right = bound_face_centers[0, :] > domain["xmax"] - tol
+            left = x < domain["xmin"] + tol
+            right = x > domain["xmax"] - tol
 
-            labels = np.array(["neu"] * bound_faces.size)
-            labels[right] = "dir"
+            left_faces = bound_faces[left]
+            right_faces = bound_faces[right]
 
-            bc_val = np.zeros(g.num_faces)
-            bc_val[bound_faces[left]] = -a_dim * g.face_areas[bound_faces[left]]
-            bc_val[bound_faces[right]] = 1
+            # Inflow on the left boundary. The gathered face areas are a copy,
+            # and can be scaled in place before they are scattered to bc_val.
+            inflow = g.face_areas[left_faces]
+            inflow *= -a_dim
+            bc_val = np.zeros_like(g.face_areas)
+            bc_val[left_faces] = inflow
+            bc_val[right_faces] = 1
 
-            bound = pp.BoundaryCondition(g, bound_faces, labels)
+            # Boundary faces are Neumann by default, only the Dirichlet faces
+            # need to be specified.
+            bound = pp.BoundaryCondition(g, right_faces, "dir")
             specified_parameters.update({"bc": bound, "bc_values": bc_val})
         else:
             bound = pp.BoundaryCondition(g, np.empty(0), np.empty(0))